@@ -4,25 +4,347 @@ Crime AI - 威胁分析引擎
 """
 
 import re
+import threading
+import unicodedata
 from datetime import datetime
-from typing import Dict, List, Tuple
-from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+# Aho-Corasick 自动机（可选依赖），不可用时回退到逐关键词扫描
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Hyperscan 多模式匹配库（可选依赖），没有 pyahocorasick 时用于关键词扫描
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+# RE2 正则引擎（可选依赖），线性时间匹配，不可用时使用标准库 re
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
 
-@dataclass
 class ThreatLevel:
     LOW = "low"
     MEDIUM = "medium"
     HIGH = "high"
     CRITICAL = "critical"
 
-@dataclass
-class ThreatIndicator:
+class ThreatIndicator(NamedTuple):
     keyword: str
     score: int
     category: str
 
+def _compile_regex(pattern: str):
+    """优先用 RE2 编译，RE2 不支持的语法回退到标准库 re"""
+    if RE2_AVAILABLE:
+        try:
+            return re2.compile(pattern)
+        except Exception:
+            pass
+    return re.compile(pattern)
+
+def _compile_patterns(table: List[Tuple[str, str, int, str]]) -> Tuple[Tuple[re.Pattern, Dict], ...]:
+    """预编译模式表，并预先构建命中结果（扫描和缓存时共享，返回给调用方前复制）"""
+    return tuple(
+        (_compile_regex(pattern), {"type": ptype, "description": desc, "score": score})
+        for pattern, ptype, score, desc in table
+    )
+
+
+# 紧迫性模式
+_URGENT_PATTERNS = _compile_patterns([
+    (r"right now", "urgency", 15, "表达紧迫行动意图"),
+    (r"tonight", "urgency", 15, "计划在今晚行动"),
+    (r"today.{0,40}?going to", "urgency", 15, "当天行动计划"),
+    (r"tomorrow.{0,40}?will", "urgency", 15, "明日行动计划"),
+    (r"this weekend", "urgency", 10, "周末行动计划"),
+    (r"counting down", "urgency", 20, "倒计时威胁"),
+    # NEW: 2026 patterns
+    (r"in.{0,40}?(hours?|minutes?)", "urgency", 15, "短时间行动意图"),
+    (r"final.{0,40}?warning", "urgency", 25, "最后警告"),
+    (r"time.{0,40}?is.{0,40}?running", "urgency", 20, "时间紧迫"),
+    (r"before.{0,40}?(midnight|sunrise|sunset)", "urgency", 20, "特定时间窗口"),
+    (r"once.{0,40}?(in|upon).{0,40}?time", "urgency", 15, "特定时机"),
+    # Additional urgency patterns
+    (r"at (\d+)\s*(am|pm)", "urgency", 15, "指定时间行动"),
+    (r"in (\d+)\s*hours?", "urgency", 15, "倒计时行动"),
+    # 2026-02-18 more urgency
+    (r"last.{0,40}?chance", "urgency", 20, "最后机会"),
+    (r"no.{0,40}?more.{0,40}?time", "urgency", 25, "没有时间了"),
+    (r"soon.{0,40}?happen", "urgency", 20, "即将发生"),
+    (r"waiting.{0,40}?too long", "urgency", 15, "等待太久"),
+    (r"clock.{0,40}?ticking", "urgency", 20, "时钟滴答"),
+    # Chinese urgency
+    (r"(最后|最终).{0,40}?机会", "urgency", 20, "中文最后机会"),
+    (r"没有.{0,40}?时间", "urgency", 25, "中文没时间"),
+    (r"(马上|立即|立刻).{0,40}?行动", "urgency", 25, "中文立即行动"),
+])
+
+# 受害者指定模式
+_VICTIM_PATTERNS = _compile_patterns([
+    (r"my (boss|colleague|teacher|classmate|neighbor|ex)", "targeted", 20, "指定具体目标-熟人"),
+    (r"that (guy|girl|person|man|woman)", "targeted", 15, "指定具体目标-陌生人"),
+    (r"they.{0,40}?deserve", "targeted", 20, "正当化暴力"),
+    (r"will make them pay", "targeted", 25, "报复意图"),
+    # Additional targeting patterns
+    (r"at (school|work|home)", "targeted", 20, "指定地点目标"),
+    (r"(teacher|professor|student).{0,40}?deserve", "targeted", 25, "教育场所威胁"),
+    (r"(boss|manager|ceo).{0,40}?pay", "targeted", 30, "职场报复威胁"),
+    # Chinese targeting patterns
+    (r"(老师|同学|同事|老板).{0,40}?(该|活该|死)", "targeted", 30, "中文目标威胁"),
+    # 2026-02-18 more targeting
+    (r"my (husband|wife|spouse|partner)", "targeted", 30, "配偶目标"),
+    (r"my (father|mother|parent|dad|mom)", "targeted", 25, "父母目标"),
+    (r"my (brother|sister|sibling)", "targeted", 20, "兄弟姐妹目标"),
+    (r"(kids|children|child|son|daughter)", "targeted", 25, "儿童目标"),
+    (r"(kids|children).{0,40}?deserve", "targeted", 35, "儿童受害意图"),
+    (r"at.{0,40}?(park|mall|store|church|temple)", "targeted", 20, "公共场所目标"),
+    (r"(random|anyone|anybody).{0,40}?die", "targeted", 40, "无差别伤害"),
+])
+
+# 计划模式
+_PLANNING_PATTERNS = _compile_patterns([
+    (r"going to buy", "planning", 25, "显示准备购买行为"),
+    (r"just ordered", "planning", 25, "已完成准备行为"),
+    (r"already have", "planning", 30, "已拥有工具"),
+    (r"waiting for", "planning", 20, "等待工具到位"),
+    (r"research.{0,40}?how", "planning", 20, "研究犯罪方法"),
+    # Mass attack planning
+    (r"drive.{0,40}?(truck|car).{0,40}?into", "planning", 40, "车辆冲撞计划"),
+    (r"crowd.{0,40}?people", "planning", 35, "人群攻击计划"),
+    (r"gasoline.{0,40}?(station|building)", "planning", 40, "纵火计划"),
+    # Detailed planning
+    (r"exact.{0,40}?time", "planning", 30, "精确定时"),
+    (r"watch.{0,40}?(school|work).{0,40}?every", "planning", 35, "蹲点观察"),
+    (r"know.{0,40}?routine", "planning", 30, "掌握作息规律"),
+    # Additional planning patterns
+    (r"picked (up|bought|got)", "planning", 20, "获取物品"),
+    (r"know.{0,40}?where.{0,40}?(live|work)", "planning", 25, "掌握目标位置"),
+    (r"been planning", "planning", 30, "预谋已久"),
+    (r"planned.{0,40}?out", "planning", 35, "周密计划"),
+    # Chinese planning
+    (r"(准备|计划|打算).{0,40}?(杀|砍|弄)", "planning", 35, "中文计划威胁"),
+    (r"(买|搞|弄).{0,40}?(刀|枪|药)", "planning", 30, "中文准备获取"),
+])
+
+# 极端情绪模式
+_EMOTION_PATTERNS = _compile_patterns([
+    (r"no.{0,40}?reason.{0,40}?live", "emotional", 30, "厌世情绪"),
+    (r"nothing.{0,40}?matter", "emotional", 25, "冷漠情绪"),
+    (r"finally.{0,40}?peace", "emotional", 20, "寻求解脱"),
+    # Additional emotional patterns
+    (r"(angry|mad).{0,40}?enough", "emotional", 25, "愤怒情绪积累"),
+    (r"(lost|had enough)", "emotional", 30, "绝望情绪"),
+    (r"(nobody|care|understand)", "emotional", 20, "孤独无助"),
+    # Chinese emotional
+    (r"(活着|人生).{0,40}?(没意思|无聊|累)", "emotional", 30, "中文厌世"),
+    (r"(不想|不愿).{0,40}?活", "emotional", 35, "中文轻生"),
+    (r"(恨|讨厌|气).{0,40}?(死|炸)", "emotional", 25, "中文愤怒"),
+    # 2026 new emotional patterns
+    (r"always.{0,40}?(tired|exhausted)", "emotional", 25, "持续疲劳厌世"),
+    (r"(nobody|no one).{0,40}?miss", "emotional", 35, "认为无人会在乎"),
+    (r"better.{0,40}?without.{0,40}?me", "emotional", 40, "死亡念头"),
+    (r"final.{0,40}?(goodbye|message)", "emotional", 50, "遗书迹象"),
+    # 2026-02 new patterns
+    (r"(3d|ghost).{0,40}?print", "planning", 30, "3D打印武器"),
+    (r"engineered.{0,40}?virus", "planning", 45, "工程病毒计划"),
+    (r"synthetic.{0,40}?(biology|dna)", "planning", 40, "合成生物学威胁"),
+    # 2026-02-18 more patterns
+    (r"buy.{0,40}?(knife|gun|weapon)", "planning", 35, "购买武器意图"),
+    (r"order.{0,40}?(knife|gun|weapon)", "planning", 35, "订购武器意图"),
+    (r"get.{0,40}?(knife|gun)", "planning", 30, "获取武器意图"),
+    (r"learn.{0,40}?(bomb|explosive)", "planning", 40, "学习爆炸物制作"),
+    (r"how to make.{0,40}?(bomb|poison)", "planning", 45, "制毒制爆学习"),
+    (r"mix.{0,40}?(chemical|poison)", "planning", 40, "混合化学品"),
+    (r"store.{0,40}?(weapon|knife)", "planning", 25, "储存武器"),
+    # 2026-02-18 additional emotion patterns
+    (r"(worth|living).{0,40}?nothing", "emotional", 35, "认为活着没价值"),
+    (r"(everyone|everybody).{0,40}?hate", "emotional", 30, "认为所有人都可恨"),
+    (r"(painful|hurt).{0,40}?inside", "emotional", 30, "内心痛苦"),
+    (r"just.{0,40}?(want|need).{0,40}?sleep.{0,40}?forever", "emotional", 40, "想永远沉睡"),
+    (r"(end|finish).{0,40}?everything", "emotional", 45, "想要结束一切"),
+    (r"(kill|murder).{0,40}?everyone", "emotional", 50, "想要杀掉所有人"),
+    # Chinese additional emotion
+    (r"(孤单|孤独|寂寞).{0,40}?死", "emotional", 35, "中文孤独死志"),
+    (r"(压力大|崩溃|受够了)", "emotional", 30, "中文压力崩溃"),
+    (r"(活着|人生).{0,40}?没希望", "emotional", 35, "中文绝望"),
+    # 2026-02-19 NEW patterns - infrastructure
+    (r"(wifi|wi-fi).{0,40}?jamm", "planning", 30, "WiFi干扰计划"),
+    (r"gps.{0,40}?(spoof|block)", "planning", 35, "GPS干扰计划"),
+    (r"(power|electric).{0,40}?grid.{0,40}?attack", "planning", 40, "电网攻击计划"),
+    (r"(water|gas).{0,40}?meter.{0,40}?hack", "planning", 35, "公用事业入侵"),
+    # 2026-02-19 more patterns
+    (r"(signal|cell).{0,40}?jamm", "planning", 30, "手机信号干扰"),
+    (r"(zero.?day|0day).{0,40}?exploit", "planning", 45, "零日漏洞利用"),
+    (r"(apt|advanced.{0,40}?persistent).{0,40}?threat", "planning", 40, "高级持续性威胁"),
+    # 2026-02-21 NEW detection patterns
+    (r"(airtag|apple tag|galaxy tag).{0,40}?track", "surveillance", 35, "AirTag跟踪检测"),
+    (r"(location|gps).{0,40}?real.?time", "surveillance", 30, "实时位置监控"),
+    (r"(find my|findmy).{0,40}?(device|friend|person)", "surveillance", 25, "查找功能滥用"),
+    (r"(spy|stalker).{0,40}?ware", "surveillance", 40, "间谍软件检测"),
+    (r"(augmented|mixed|extended).{0,40}?reality", "emerging", 30, "AR/VR/MR威胁"),
+    # Chinese 2026-02-21 patterns
+    (r"(定位|跟踪|监视).{0,40}?(软件|app|应用)", "surveillance", 35, "中文定位跟踪"),
+    (r"(实时|精确).{0,40}?位置", "surveillance", 30, "中文实时位置"),
+    # 2026-02-21 MORE detection patterns
+    (r"(deepfake|ai.{0,40}?合成).{0,40}?(不雅|裸|色情)", "content_abuse", 45, "AI不雅内容威胁"),
+    (r"(face swap|换脸).{0,40}?(视频|image|图片)", "content_abuse", 35, "换脸滥用"),
+    (r"(voice clone|语音克隆).{0,40}?(诈骗|敲诈)", "fraud", 40, "语音克隆诈骗"),
+    (r"(non.?consensual|未经同意).{0,40}?(image|video|photo)", "content_abuse", 45, "未经同意内容"),
+])
+
+# 所有模式按检测顺序合并为一张表，单循环完成扫描
+_PATTERN_TABLE = _URGENT_PATTERNS + _VICTIM_PATTERNS + _PLANNING_PATTERNS + _EMOTION_PATTERNS
+
+# 不含正则元字符的模式直接用子串判断，省去正则引擎开销
+_REGEX_METACHARS = re.compile(r"[.^$*+?{}\[\]\\|()]")
+_LITERAL_PATTERNS = tuple(
+    (regex.pattern, hit) for regex, hit in _PATTERN_TABLE
+    if not _REGEX_METACHARS.search(regex.pattern)
+)
+def _requires_cjk(pattern: str) -> bool:
+    """模式的字面字符全是中文时，任何匹配都必然包含中文，纯英文文本可以跳过"""
+    literals = re.sub(r"\{\d*,?\d*\}|[.^$*+?\[\]\\|()]", "", pattern)
+    return bool(literals) and all("\u4e00" <= char <= "\u9fff" for char in literals)
+
+# 中文字符
+_CJK_RE = re.compile("[\u4e00-\u9fff]")
+
+# (正则, 命中结果, 是否只可能匹配中文文本)
+_REGEX_PATTERNS = tuple(
+    (regex, hit, _requires_cjk(regex.pattern)) for regex, hit in _PATTERN_TABLE
+    if _REGEX_METACHARS.search(regex.pattern)
+)
+
+def _build_pattern_database():
+    """把全部检测模式编译为一个 Hyperscan 数据库，不可用或编译失败时返回 None"""
+    if not HYPERSCAN_AVAILABLE:
+        return None
+    expressions = [re.escape(literal) for literal, _ in _LITERAL_PATTERNS]
+    expressions += [regex.pattern for regex, _, _ in _REGEX_PATTERNS]
+    try:
+        database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        database.compile(
+            expressions=[expression.encode("utf-8") for expression in expressions],
+            ids=list(range(len(expressions))),
+            flags=hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP | hyperscan.HS_FLAG_SINGLEMATCH
+        )
+    except hyperscan.error:
+        return None
+    return database
+
+# 一次扫描检测全部模式；命中 id 与 _PATTERN_HITS 下标对应（字面量在前，与逐个检测的顺序一致）
+_PATTERN_DATABASE = _build_pattern_database()
+_PATTERN_HITS = tuple(hit for _, hit in _LITERAL_PATTERNS) + tuple(hit for _, hit, _ in _REGEX_PATTERNS)
+
+# Hyperscan 扫描需要 scratch 空间，数据库自带的 scratch 不能被多个线程同时使用，因此每个线程各自分配
+_HS_LOCAL = threading.local()
+
+def _hs_scratch(database):
+    """返回当前线程专用于该数据库的 scratch，首次使用时分配"""
+    scratches = getattr(_HS_LOCAL, "scratches", None)
+    if scratches is None:
+        scratches = _HS_LOCAL.scratches = {}
+    scratch = scratches.get(id(database))
+    if scratch is None:
+        scratch = scratches[id(database)] = hyperscan.Scratch(database)
+    return scratch
+
+# 计入犯罪概率的威胁等级
+_HIGH_RISK_LEVELS = frozenset((ThreatLevel.HIGH, ThreatLevel.CRITICAL))
+
+# 分数 (0-100) -> 威胁等级 / 风险标签 / 预测描述 查找表
+_THREAT_LEVEL_TABLE = (
+    (ThreatLevel.LOW,) * 40 + (ThreatLevel.MEDIUM,) * 20
+    + (ThreatLevel.HIGH,) * 20 + (ThreatLevel.CRITICAL,) * 21
+)
+_RISK_LABEL_TABLE = ("minimal",) * 20 + ("low",) * 20 + ("moderate",) * 20 + ("high",) * 20 + ("extreme",) * 21
+_PREDICTION_TABLE = (
+    ("✅ 风险极低",) * 20 + ("🟢 低风险，继续观察",) * 20 + ("🟡 中等风险，保持监控",) * 20
+    + ("🔴 中高风险，建议密切关注",) * 20 + ("⚠️ 高概率犯罪风险，建议立即介入",) * 21
+)
+
+# 高风险地点关键词
+_HIGH_RISK_AREAS = ("school", "government", "mall", "public")
+
+# 按小时查表的时间因素（0-5 点凌晨风险更高）
+_HOUR_FACTOR = (1.5,) * 6 + (1.0,) * 18
+
+def _is_ascii_word_char(char: str) -> bool:
+    """是否为 ASCII 字母或数字"""
+    return char.isascii() and char.isalnum()
+
+def _needs_word_start(keyword: str) -> bool:
+    """以 ASCII 字母/数字开头的关键词需要匹配在词首（避免 skill 命中 kill）；中文关键词不需要"""
+    return _is_ascii_word_char(keyword[:1])
+
+# 以关键词开头、但本身无害的常见英文词（robot 含 rob、stable 含 stab、because 含 bec），整词出现时不计为命中；
+# 其余词形照常命中（robbery、stabbings、gunman）
+_BENIGN_WORDS = frozenset((
+    "robot", "robots", "robotic", "robotics", "robo", "roblox", "robin", "robins", "robinson",
+    "robe", "robes", "robust", "robustly", "robustness", "robert", "roberts", "robertson", "robyn",
+    "gunner", "gunners", "gundam", "gunk",
+    "stable", "stabler", "stablest", "stably", "stablecoin", "stablecoins", "stability", "stabilities",
+    "stabilize", "stabilized", "stabilizes", "stabilizing", "stabilizer", "stabilizers", "stabilization",
+    "stabilise", "stabilised", "stabilises", "stabilising", "stabiliser", "stabilisers", "stabilisation",
+    "hackathon", "hackathons", "hackney", "hackle", "hackles",
+    "hurtle", "hurtles", "hurtled", "hurtling",
+    "killjoy", "killjoys",
+    "bombay", "bombastic", "bombastically",
+    "scamp", "scamps", "scampi", "scamper", "scampers", "scampered", "scampering",
+    "rapeseed",
+    "uberx", "uberxl", "ubereats",
+    "because", "become", "becomes", "becoming", "became", "becalmed", "bechamel",
+    "beck", "becks", "beckon", "beckons", "beckoned", "beckoning", "becky", "beckham", "beckett", "becker",
+    "stealth", "stealthy", "stealthily",
+    "swordfish",
+))
+
+# 从某位置起的 ASCII 单词（文本已转小写），用于和 _BENIGN_WORDS 比较
+_ASCII_WORD_RE = re.compile(r"[a-z0-9]*")
+_ASCII_WORD_BYTES_RE = re.compile(rb"[a-z0-9]*")
+
+def _benign_words(keyword: str) -> frozenset:
+    """以该关键词开头的无害词；绝大多数关键词为空集，扫描时无需额外检查"""
+    if not _needs_word_start(keyword):
+        return frozenset()
+    return frozenset(word for word in _BENIGN_WORDS if word != keyword and word.startswith(keyword))
+
+def _find_at_word_start(text: str, keyword: str, benign_words: frozenset) -> bool:
+    """查找位于词首、且所在单词不是无害词的关键词出现位置"""
+    start = text.find(keyword)
+    while start != -1:
+        if not (start > 0 and _is_ascii_word_char(text[start - 1])) and (
+            not benign_words or _ASCII_WORD_RE.match(text, start).group() not in benign_words
+        ):
+            return True
+        start = text.find(keyword, start + 1)
+    return False
+
+# 扫描结果缓存：最多缓存的文本数，以及参与缓存的最大文本长度（避免长文本占用内存）
+_SCAN_CACHE_SIZE = 4096
+_SCAN_CACHE_MAX_LENGTH = 2000
+
+# 零宽字符（常被插入关键词中间以规避检测）
+_ZERO_WIDTH_RE = re.compile("[\u200b\u200c\u200d\u2060\ufeff]")
+
+# 任意字母（含中文）；所有关键词和模式都至少包含一个字母
+_LETTER_RE = re.compile(r"[^\W\d_]")
+
+
 class ThreatAnalyzer:
-    """威胁分析器 - 检测潜在犯罪信号"""
+    """威胁分析器 - 检测潜在犯罪信号（扫描表在首次实例化时加锁构建、构建完成后才发布，在类上共享；实例可跨线程复用）"""
+    
+    __slots__ = ("threat_keywords", "_cached_scan")
     
     # 暴力相关关键词及其威胁分数
     VIOLENCE_KEYWORDS = {
@@ -127,11 +449,11 @@ class ThreatAnalyzer:
         "炸弹客": 95, "纵火犯": 85, "投毒者": 90,
         "杀人犯": 95, "凶手": 90, "罪犯": 70, "变态": 65,
         # Chinese emerging
-        "电信诈骗": 65, "杀猪盘": 70, "冒充": 55, "钓鱼": 55,
+        "电信诈骗": 65, "杀猪盘": 75, "冒充": 55, "钓鱼": 55,
         # 2026-02-18 Auto-Optimize: NEW emerging threats
         "ai诈骗": 65, "语音伪造": 70, "视频伪造": 70, "裸聊诈骗": 80,
         "虚假绑架": 80, "ai换脸": 65, "深度伪造": 70, "勒索视频": 75,
-        "快递诈骗": 60, "刷单诈骗": 65, "虚假投资": 70, "假冒客服": 65,
+        "快递诈骗": 65, "刷单诈骗": 65, "虚假投资": 70, "假冒客服": 65,
         "FaceTime诈骗": 70, "苹果ID诈骗": 75, "钓鱼链接": 60,
         # Chinese new threats 2026
         "无人机袭": 85, "无人机攻击": 85, "植入侵入": 90,
@@ -140,7 +462,7 @@ class ThreatAnalyzer:
         "电网攻击": 80, "水务攻击": 75, "交通系统": 70,
         "智慧城市漏洞": 65, "工业控制系统": 80, "scada攻击": 85,
         # Chinese social
-        "网络暴力": 65, "软暴力": 60, "精神控制": 75, "pua": 70,
+        "软暴力": 60, "精神控制": 75, "pua": 70,
         "职场霸凌": 65, "校园霸凌": 70, "网络敲诈": 75,
         
         # 2026-02-18 auto-optimize - NEW emerging threats
@@ -169,19 +491,19 @@ class ThreatAnalyzer:
         "ai attack": 70, "deepfake": 55, "bioweapon": 90,
         "mass poison": 95, "radiation": 85, "chemical weapon": 90,
         "incel": 65, "mass killer": 100, "stabbing spree": 90,
-        "hammer attack": 80, "vehicle ramming": 85,
+        "hammer attack": 80,
         "校园": 60, "幼儿园": 70, "小学": 60, "中学": 55,
         "投鼠忌器": 75, "狗急跳墙": 70, "铤而走险": 75,
         # 2026 new threats
-        "drone attack": 85, "iot botnet": 55, "supply chain": 60,
+        "drone attack": 85, "iot botnet": 60, "supply chain": 60,
         "swatting hoax": 75, "fake bomb": 65, "copycat": 50,
-        "gas attack": 90, "nerve gas": 100, " Dirty bomb": 95,
+        "gas attack": 90, "nerve gas": 100,
         "school shooting": 100, "workplace violence": 85,
         "domestic terrorism": 90, "lone wolf": 85,
         "意识形态": 70, "极端主义": 85, "圣战": 95,
         "独狼": 85, "自我激化": 90, "恐怖宣传": 75,
         # Emerging threats 2026
-        "deepfake blackmail": 70, "ai generated abuse": 75,
+        "deepfake blackmail": 70, "ai generated abuse": 85,
         "swatting service": 80, "pipe bomb": 90,
         "improvised explosive": 85, "ied": 85,
         # 2026 new keywords
@@ -193,11 +515,11 @@ class ThreatAnalyzer:
         "jihad": 90, "white supremacist": 85, "nazi": 80,
         "extremist forum": 75, "terror manual": 90, "bomb recipe": 95,
         # 2026 emerging threats
-        "voice clone": 65, "synthetic identity": 60, "ai fraud": 70,
+        "voice clone": 65, "synthetic identity": 70, "ai fraud": 70,
         "deep voice": 65, "face swap": 55, "ai harassment": 70,
         "automated swat": 80, "zoombombing": 55, "doxbin": 75,
         # New attack vectors
-        "evil twin": 50, "juice jacking": 55, "RFID skimming": 55,
+        "evil twin": 50, "juice jacking": 55,
         "carding": 55, "credential stuffing": 60, "MFA bombing": 70,
         # Chemical/biological
         "nerve agent": 100, "mustard gas": 95, "sarin": 100,
@@ -212,7 +534,7 @@ class ThreatAnalyzer:
         "3d printed gun": 80, "ghost gun": 80, "80% lower": 75,
         "pipe gun": 75, "zip gun": 80,
         "finsta": 50, "finstagram": 50, "private account": 45,
-        " burner account": 50, "throwaway": 45,
+        "burner account": 50, "throwaway": 45,
         "copypasta": 40, "meme threat": 55,
         # New targeting
         "influencer": 45, "content creator": 45, "streamer": 50,
@@ -223,46 +545,40 @@ class ThreatAnalyzer:
         "maga attack": 70, "capital riot": 80,
         # Social media threats
         "troll farm": 60, "disinformation": 55, "fake news attack": 60,
-        "bot army": 55, "coordinated attack": 70,
+        "bot army": 60, "coordinated attack": 70,
         # New methods
         "water poisoning": 90, "air poisoning": 85,
         "crop duster": 75, "drone delivery": 70,
         "package bomb": 90, "letter bomb": 90,
         # Financial threats
-        "cryptojacking": 55, "exchange hack": 70, "nft scam": 50,
-        "pump and dump": 45, "rug pull": 55,
+        "cryptojacking": 55, "exchange hack": 70, "nft scam": 55,
+        "pump and dump": 45, "rug pull": 75,
         
         # 2026-02 new threats
-        "ai scam": 65, "romance scam": 60, "pig butchering": 70,
-        "job scam": 55, "fake celebrity": 60, "impersonation": 55,
-        "qr code scam": 50, "voice deepfake": 65, "video deepfake": 65,
+        "ai scam": 65, "romance scam": 65, "pig butchering": 75,
+        "job scam": 65, "fake celebrity": 60, "impersonation": 55,
+        "qr code scam": 50, "voice deepfake": 80, "video deepfake": 65,
         # Social engineering
         "pretexting": 50, "baiting": 55, "quid pro quo": 55,
         "tailgating": 45, "shoulder surfing": 50,
         # New violence methods
-        "acid attack": 90, "machete": 80, "crossbow": 75,
+        "acid attack": 90, "crossbow": 75,
         "crossbow attack": 85, "balloon bomb": 90,
         # 2026 weapon tech
-        "3d printed weapon": 80, "ghost gun": 80, "80% lower": 75,
-        "zip gun": 80, "pipe gun": 75,
+        "3d printed weapon": 80,
         # Space/infrastructure threats
         "satellite attack": 85, "space debris": 60, "orbital weapon": 90,
-        "power grid": 75, "infrastructure attack": 80,
+        "infrastructure attack": 80,
         # Biological 2026
         "engineered virus": 100, "synthetic biology": 90, "gene editing weapon": 95,
         # AI threats
-        "autonomous weapon": 85, "killer robot": 90, "military ai": 80,
+        "autonomous weapon": 90, "killer robot": 95, "military ai": 80,
         "deepfake extortion": 75, "synthetic identity theft": 70,
         
         # 2026-02 new threats (auto-optimize)
         "train attack": 85, "metro attack": 80, "subway attack": 80,
         "airport threat": 85, "bridge attack": 85, "tunnel attack": 80,
         "ai impersonation": 70, "faceless": 65, "cloaked": 60,
-        # Additional 2026 threats
-        "electric shock": 75, "taser attack": 80, "laser blind": 65,
-        "package bomb": 90, "letter bomb": 90,
-        "engineered virus": 100, "synthetic biology": 90, "gene editing weapon": 95,
-        "autonomous weapon": 85, "killer robot": 90, "military ai": 80,
         # Chinese 2026
         "火车袭击": 85, "地铁袭击": 80, "机场威胁": 85,
         "人工智能冒充": 70, "合成病毒": 100, "基因武器": 95,
@@ -271,7 +587,7 @@ class ThreatAnalyzer:
         "social engineering": 55, "spear phishing": 60, "whaling": 65,
         "credential harvest": 60, "token theft": 65, "session hijack": 70,
         "sim swap": 70, "eSIM exploit": 65, "number port": 60,
-        "ai generated threats": 75, "synthetic voices": 65, "face swap abuse": 60,
+        "ai generated threats": 75, "synthetic voices": 65, "face swap abuse": 75,
         "revenge porn": 75, "intimate image": 70, "deepnude": 80,
         "bomb threat": 90, "swatting call": 80, "fake emergency": 75,
         "radiation threat": 85, "dirty bomb": 95, "contamination": 70,
@@ -282,20 +598,13 @@ class ThreatAnalyzer:
         # 2026-02-17 MORE keywords (auto-optimize v2)
         "serial attack": 90, "copycat crime": 55, "mass casualty": 95,
         "public shooting": 95, "assassination": 85, "targeted killing": 90,
-        "IED": 85, "pressure cooker": 80, "fertilizer bomb": 85,
+        "pressure cooker": 80, "fertilizer bomb": 85,
         "incel attack": 85, "misogynistic": 60, "incel manifesto": 90,
         "rape threat": 85, "sexual assault threat": 80,
         # Chinese more
         "连续作案": 85, "模仿犯罪": 55, "公共场所行凶": 95,
-        "暗杀": 85, "针对性杀害": 90, "土制炸弹": 90,
+        "暗杀": 85, "针对性杀害": 90,
         "单身攻击": 85, "厌女攻击": 85, "强奸威胁": 85,
-        # New attack methods
-        "car attack": 80, "vehicle attack": 80, "truck attack": 85,
-        "ramming attack": 85, "vehicle ramming": 90,
-        "machete": 80, "sword": 70, "acid throwing": 90, "glass attack": 75,
-        # Infrastructure
-        "power grid": 80, "water supply": 75, "food tampering": 80,
-        "airline threat": 85, "maritime threat": 75,
         # 2026-02-18 NEW - Emerging attack vectors
         "airtag stalking": 70, "airtag tracking": 70, "find my weapon": 80,
         "crowdstrike": 55, "global outage": 60, "supply chain attack": 75,
@@ -305,7 +614,7 @@ class ThreatAnalyzer:
         # Chinese 2026-02
         "定位器跟踪": 70, "电子定位": 65, "全球停电": 60,
         "供应链攻击": 75, "勒索软件服务": 70, "物联网漏洞": 60,
-        "智能设备入侵": 55, "汽车破解": 70, "车辆漏洞": 75,
+        "智能设备入侵": 65, "汽车破解": 70, "车辆漏洞": 75,
         # 2026-02-17 auto-optimize v3
         "clop ransomware": 75, "lockbit": 70, "alphv": 70, "ransum": 65,
         "cpu exhaustion": 55, "memory exhaustion": 55, "disk exhaustion": 50,
@@ -322,7 +631,7 @@ class ThreatAnalyzer:
         "crypto drainer": 75, "approval phishing": 70, "address poisoning": 65,
         "ice phishing": 65, "bridge exploit": 80, "mixer": 55,
         # Chinese crypto threats
-        "币圈诈骗": 70, "跑路": 65, "土狗": 50, "貔貅": 60,
+        "币圈诈骗": 70, "跑路": 75, "土狗": 50, "貔貅": 60,
         # 2026-02 new attack surfaces
         "esim swap": 70, "callback phishing": 75, "vat phishing": 70,
         "adversary in the middle": 80, "aitm": 75,
@@ -340,7 +649,7 @@ class ThreatAnalyzer:
         "space weapon": 90, "satellite jamming": 80, "orbital strike": 95,
         # Chinese 2026
         "元宇宙攻击": 65, "虚拟现实威胁": 70, "数字人诈骗": 75,
-        "AI克隆": 70, "深度伪造敲诈": 80, "智能设备入侵": 65,
+        "AI克隆": 70, "深度伪造敲诈": 80,
         "医疗设备黑客": 85, "植入物攻击": 90, "起搏器黑客": 95,
         "选举干预": 80, "投票操纵": 85, "虚假候选人": 75,
         "卫星干扰": 80, "轨道武器": 95,
@@ -350,19 +659,6 @@ class ThreatAnalyzer:
         "ceo fraud": 75, "business email": 70, "wire fraud": 75,
         # 2026-02-18 NEWEST - Feb 18
         "quantum decryption": 85, "harvest now decrypt later": 90, "store now break later": 85,
-        "ai agent attack": 75, "autonomous hacking": 80, "self-propagating malware": 85,
-        "social graph attack": 70, "relationship exploit": 65, "family targeting": 75,
-        # Chinese newest
-        "量子解密": 85, "现在存储以后破解": 90, "AI智能体攻击": 75,
-        "自主黑客": 80, "自传播恶意软件": 85, "社交图谱攻击": 70,
-        # 2026-02-18 auto-optimize additional
-        "clone attack": 75, "identity theft": 65, "passport fraud": 70,
-        "fingerprint hack": 75, "retina scan bypass": 80, "biometric hack": 75,
-        "smart dust": 85, "nanobot": 80, "microscopic weapon": 90,
-        "emp attack": 95, "electromagnetic pulse": 95, "power outage": 60,
-        # 2026 emerging
-        "brain computer": 65, "neural interface": 70, "mind hack": 80,
-        "thought attack": 85, "cognitive warfare": 75, "memory manipulation": 80,
         # 2026-02-18 auto-optimize additions
         "airdrop scam": 55, "nft mint scam": 60, "discord scam": 55,
         "fake exchange": 65, "ponzi scheme": 70, "pyramid scheme": 70,
@@ -372,24 +668,14 @@ class ThreatAnalyzer:
         "ai kidnapping": 80, "simulation attack": 75, "synthetic witness": 70,
         # Infrastructure 2026
         "water hack": 80, "dam hack": 85, "traffic light hack": 70,
-        "smart city attack": 75, "iot botnet": 60, "firmware attack": 70,
+        "smart city attack": 75, "firmware attack": 70,
         # Chinese emerging
         "空气净化器攻击": 75, "智能家居漏洞": 65, "汽车远程入侵": 70,
-        "无人机集群攻击": 85, "区块链攻击": 65, "Defi攻击": 70,
-        # 2026-02-18 Auto-Optimize: NEW emerging threats
-        "ai诈骗": 65, "语音伪造": 70, "视频伪造": 70, "裸聊诈骗": 80,
-        "虚假绑架": 80, "ai换脸": 65, "深度伪造": 70, "勒索视频": 75,
-        "快递诈骗": 60, "刷单诈骗": 65, "虚假投资": 70, "假冒客服": 65,
-        "FaceTime诈骗": 70, "苹果ID诈骗": 75, "钓鱼链接": 60,
-        "无人机袭": 85, "植入侵入": 90, "智能穿戴攻击": 75,
-        "汽车黑客": 70, "远程控制": 65, "电网攻击": 80, "水务攻击": 75,
-        "交通系统": 70, "智慧城市漏洞": 65, "工业控制系统": 80, "scada攻击": 85,
-        "网络暴力": 65, "软暴力": 60, "精神控制": 75, "pua": 70,
-        "职场霸凌": 65, "校园霸凌": 70, "网络敲诈": 75,
+        "无人机集群攻击": 90, "区块链攻击": 65, "Defi攻击": 70,
         # English 2026 new
         "facetime scam": 70, "apple id scam": 75, "brushing scam": 65,
         "fake investment": 70, "fake customer service": 65, "deepfake ransom": 75,
-        "ai voice scam": 70, "video call scam": 75, "smart wearable": 65,
+        "ai voice scam": 70, "smart wearable": 65,
         "wearable hack": 70, "implant hack": 90, "car remote hack": 70,
         "vehicle remote": 70, "power grid attack": 80, "water system": 75,
         "traffic control": 70, "smart city": 65, "ics attack": 80, "scada": 85,
@@ -398,21 +684,21 @@ class ThreatAnalyzer:
         "gaslighting": 70, "mobbing": 65, "workplace bullying": 65, "school bullying": 70,
         # 2026-02-18 late additional
         "data breach": 60, "info leak": 55, "privacy violation": 55,
-        "doxxing service": 65, "swatting service": 80, "bomb threat call": 90,
+        "doxxing service": 65, "bomb threat call": 90,
         "fake emergency call": 75, "hoax threat": 70, "copycat threat": 55,
         # 2026 financial
-        "pig butchering": 75, "crypto scam": 65, "nft scam": 55,
-        "rug pull": 60, "pump dump": 55, "honeypot": 55,
+        "crypto scam": 65,
+        "pump dump": 55, "honeypot": 55,
         # Chinese late
         "数据泄露": 60, "信息泄露": 55, "隐私侵犯": 55,
         "人肉服务": 65, "炸弹威胁电话": 90, "虚假报警": 75,
-        "杀猪盘": 75, "加密货币诈骗": 65, "NFT诈骗": 55,
+        "加密货币诈骗": 65, "NFT诈骗": 55,
         # 2026-02-18 more
-        "human trafficking": 90, "organ trafficking": 95, "child trafficking": 100,
-        "kidnap for ransom": 85, "virtual kidnapping": 80,
+        "human trafficking": 95, "organ trafficking": 95, "child trafficking": 100,
+        "kidnap for ransom": 85,
         "sex trafficking": 95, "forced labor": 85, "slavery": 90,
         "拐卖": 95, "人口贩卖": 95, "器官交易": 95,
-        "绑架勒索": 85, "强迫劳动": 85, "奴役": 90,
+        "强迫劳动": 85, "奴役": 90,
         # 2026-02-19 new
         "跳楼": 85, "割腕": 90, "服毒": 85, "上吊": 90, "烧炭": 90,
         "自杀直播": 95, "自杀录像": 95, "死亡直播": 90,
@@ -437,7 +723,7 @@ class ThreatAnalyzer:
         "ransomware gang": 75, "apt attack": 80, "zero day": 85,
         # Chinese Feb 19 more
         "信号干扰": 65, "手机屏蔽": 60, "物联网入侵": 55,
-        "僵尸网络": 60, "勒索软件": 65, "零日漏洞": 85,
+        "勒索软件": 65, "零日漏洞": 85,
         # 2026-02-19 late emerging
         "ai war": 80, "algorithmic attack": 75, "automated terror": 85,
         "chemical attack": 90, "biological attack": 95, "radiological attack": 90,
@@ -447,7 +733,7 @@ class ThreatAnalyzer:
         "network infiltration": 70, "supply chain poisoning": 80, "library attack": 65,
         "dependency confusion": 70, "typosquatting": 55, "喝水银": 95,
         # 2026-02-19 latest
-        "smishing": 55, "vishing": 60, "quishing": 65,  # QR phishing
+        "smishing": 55, "vishing": 70, "quishing": 65,  # QR phishing
         "proxy hopping": 50, "tor bridge": 45, "onion routing": 50,
         # 2026-02-19 mid-day emerging
         "clipboard hijack": 55, "browser hook": 60, "screen capture": 50,
@@ -456,11 +742,11 @@ class ThreatAnalyzer:
         "deepfake campaign": 70, "influence operation": 65, "disinformation bot": 60,
         "astroturfing": 55, "sock puppet": 50, "fake influencer": 55,
         # 2026-02-19 midday emerging
-        "injury fake": 70, "accident scam": 65, "insurance fraud": 60,
+        "injury fake": 70, "accident scam": 65, "insurance fraud": 65,
         "fake disability": 65, "wheelchair fraud": 70, "parasitic injury": 75,
         # 2026-02-19 afternoon emerging
-        "cryptojacking": 55, "drive-by download": 60, "watering hole": 65,
-        "spear phishing": 60, "whaling attack": 70, " BEC": 65,
+        "drive-by download": 60, "watering hole": 65,
+        "whaling attack": 70, "BEC": 65,
         # 2026-02-19 early afternoon
         "loan scam": 55, "predatory lending": 60, "payday loan trap": 65,
         "debt bondage": 70, "wage garnishment fraud": 65, "identity loan": 70,
@@ -481,7 +767,7 @@ class ThreatAnalyzer:
         "fake antivirus": 65, "browser popup scam": 55, "fake update": 60,
         # 2026-02-19 night
         "IRS scam": 65, "tax fraud": 60, "fake tax refund": 65,
-        "identity theft": 60, "ssn scam": 65, "credit freeze fraud": 70,
+        "ssn scam": 65, "credit freeze fraud": 70,
         # 2026-02-19 night continued
         "government grant scam": 60, "business grant fraud": 65, "fake funding": 55,
         "CEO impersonation": 70, "executive fraud": 65, "wire transfer scam": 70,
@@ -502,7 +788,7 @@ class ThreatAnalyzer:
         "shell company": 55, "front business": 55, "hidden assets": 60,
         # 2026-02-20 late night
         "tax evasion": 65, "offshore account": 60, "secret bank": 55,
-        "blind trust": 55, " nominee": 50, "straw man": 55,
+        "blind trust": 55, "nominee": 50, "straw man": 55,
         # 2026-02-20 auto-optimize new threats
         "ransomware 2.0": 80, "lockfile ransomware": 75,
         "ai jailbreak service": 70, "prompt injection": 65,
@@ -512,22 +798,22 @@ class ThreatAnalyzer:
         "Keycard hack": 70, "badge clone": 65, "tailgate": 45,
         "turnstile jump": 40, "security bypass": 55,
         # Chinese Feb 20 new
-        "数据投毒": 70, "模型提取": 60, "AI越狱服务": 70,
+        "数据投毒": 75, "模型提取": 60, "AI越狱服务": 70,
         "提示词注入": 65, "门禁卡破解": 70, "尾随入侵": 45,
         
         # 2026-02-21 new emerging threats
-        "supply chain poisoning": 80, "library compromise": 70,
+        "library compromise": 70,
         "dependency hijack": 75, "npm compromise": 70, "pypi poison": 70,
         "clone site": 55, "typosquat": 50, "lookalike domain": 55,
         # Chinese Feb 21
-        "供应链投毒": 80, "依赖劫持": 75, "npm投毒": 70,
+        "依赖劫持": 75, "npm投毒": 70,
         "钓鱼网站": 55, "钓鱼域名": 55, "假冒网站": 55,
         
         # 2026-02-20 pre-dawn
         "kidnapping": 85, "abduction": 80, "hostage": 90,
         "ransom demand": 85, "snatching": 75, "white van": 70,
         # 2026-02-21 new emerging
-        "location stalking": 75, "airtag stalking": 70, "find my weapon": 80,
+        "location stalking": 75,
         "live location": 65, "real-time tracking": 70, "gps tracker": 65,
         "stalkerware": 80, "spyware app": 75, "creepware": 70,
         # Chinese Feb 21 new
@@ -537,8 +823,8 @@ class ThreatAnalyzer:
         "augmented reality attack": 75, "ar overlay": 70, "ar hijack": 80,
         "mixed reality threat": 65, "xr assault": 70,
         # 2026-02-21 MORE emerging
-        "deepfake nsfw": 80, "ai generated abuse": 85, "non-consensual ai": 85,
-        "face swap abuse": 75, "voice clone fraud": 80, "synthetic identity theft": 70,
+        "deepfake nsfw": 80, "non-consensual ai": 85,
+        "voice clone fraud": 80,
         # Chinese MORE Feb 21
         "AI不雅视频": 80, "深度伪造滥用": 85, "AI换脸犯罪": 80,
         "语音克隆诈骗": 80, "合成身份盗窃": 70,
@@ -551,16 +837,16 @@ class ThreatAnalyzer:
         "PayPal争议欺诈": 70, "拒付欺诈": 65, "虚假退款": 65,
         "短链接诈骗": 50, "二维码诈骗": 60,
         # 2026-02-21 MORE morning emerging
-        "rug pull": 75, "honeypot contract": 80, "flash loan attack": 85,
+        "honeypot contract": 80, "flash loan attack": 85,
         "defi exploit": 80, "oracle manipulation": 75, "flash crash": 70,
         "nft floor manipulation": 70, "wash trading": 65, "fake volume": 60,
         # 2026-02-21 social engineering NEW
-        "shoulder surfing": 45, "visual hacking": 50, "tailgating": 40,
+        "visual hacking": 50,
         "badge cloning": 55, "rfid skimming": 60, "eavesdropping": 50,
         # Chinese Feb 21 MORE
-        "跑路": 75, "蜜罐合约": 80, "闪电贷攻击": 85,
+        "蜜罐合约": 80, "闪电贷攻击": 85,
         "DeFi漏洞": 80, "预言机操纵": 75, "NFT地板价操纵": 70,
-        "肩窥": 45, "尾随": 40, "门禁克隆": 55, "RFID盗刷": 60,
+        "肩窥": 50, "尾随": 40, "门禁克隆": 55, "RFID盗刷": 60,
         # 2026-02-21 LATE morning emerging
         "data broker": 55, "info broker": 50, "people search": 45,
         "background check": 50, "skip trace": 55, "address lookup": 45,
@@ -570,7 +856,7 @@ class ThreatAnalyzer:
         "5g tower": 60, "cell tower": 55, "base station": 55,
         "utility pole": 50, "power pole": 55, "telecom cabinet": 50,
         # Chinese Feb 21 late
-        "数据经纪人": 55, "信息买卖": 50, "人肉搜索": 70,
+        "数据经纪人": 55, "信息买卖": 50,
         "背景调查": 50, "地址查询": 45, "电话查询": 45,
         "红绿灯入侵": 55, "智能灯杆": 50, "5G基站": 60,
         # 2026-02-21 NEW emerging threats
@@ -582,7 +868,7 @@ class ThreatAnalyzer:
         "buy followers": 45, "bot followers": 40, "fake engagement": 50,
         # Chinese Feb 21 NEW
         "招聘诈骗": 60, "虚假招聘": 55, "付费培训": 55,
-        "刷单诈骗": 60, "点赞诈骗": 55, "虚假实习": 50,
+        "虚假实习": 50,
         "粉丝账号入侵": 55, "冒充粉丝": 50, "买粉": 45,
         # 2026-02-21 10AM emerging
         "ev charging scam": 60, "fake充电桩": 55, "charging fraud": 60,
@@ -598,10 +884,10 @@ class ThreatAnalyzer:
         # 2026-02-21 11AM emerging
         "fake browser": 50, "browser spoofing": 55, "ua spoof": 50,
         "fingerprint spoof": 60, "device spoof": 55, "incognito bypass": 45,
-        "cookie theft": 55, "session theft": 60, "token theft": 65,
+        "cookie theft": 55, "session theft": 60,
         # 2026-02-21 cloud NEW
-        "cloudflare bypass": 50, "waf bypass": 55, "cdn bypass": 50,
-        "ip rotation": 45, "residential proxy": 50, " datacenter ip": 40,
+        "cloudflare bypass": 50,
+        "ip rotation": 45, "residential proxy": 50, "datacenter ip": 40,
         # Chinese 11AM Feb 21
         "浏览器伪造": 50, "设备指纹伪造": 60, "隐身绕过": 45,
         "Cookie盗窃": 55, "会话窃取": 60, "令牌盗窃": 65,
@@ -620,12 +906,12 @@ class ThreatAnalyzer:
         "游戏皮肤诈骗": 55, "账号交易": 50, "代练诈骗": 60,
         "账号盗窃": 70, "装备盗窃": 65, "游戏货币复制": 70,
         # 2026-02-21 1PM emerging
-        "fake antivirus": 55, "scareware": 60, "rogue software": 65,
+        "scareware": 60, "rogue software": 65,
         "browser hijack": 60, "search hijack": 55, "dns hijack": 65,
         "router compromise": 70, "modem hack": 65, "isp exploit": 60,
         # 2026-02-21 social NEW
         "fake protest": 50, "astro turf": 55, "fake movement": 50,
-        "bot army": 60, "troll army": 55, "influence campaign": 65,
+        "troll army": 55, "influence campaign": 65,
         # Chinese 1PM Feb 21
         "虚假杀毒": 55, "恐吓软件": 60, "恶意软件": 65,
         "浏览器劫持": 60, "搜索劫持": 55, "DNS劫持": 65,
@@ -633,16 +919,16 @@ class ThreatAnalyzer:
         "虚假抗议": 50, "水军运动": 55, "机器人军队": 60,
         # 2026-02-21 2PM emerging
         "fake degree": 55, "diploma mill": 60, "certificate fraud": 55,
-        "fake diploma": 50, "degree scam": 55, "credential fraud": 60,
-        "resume fraud": 55, "experience fake": 50, "fake employment": 55,
+        "credential fraud": 60,
+        "experience fake": 50, "fake employment": 55,
         # 2026-02-21 dating NEW
-        "romance scam": 65, "lonely heart": 55, "love scam": 60,
-        "military romance": 65, "overseas lover": 55, "doctor scam": 60,
+        "lonely heart": 55, "love scam": 60,
+        "military romance": 65,
         "sugar daddy scam": 65, "sugar mama": 60, "allowance scam": 55,
         # Chinese 2PM Feb 21
         "假学历": 55, "文凭工厂": 60, "证书欺诈": 55,
         "简历造假": 55, "经验造假": 50, "求职欺诈": 55,
-        "交友诈骗": 65, "杀猪盘": 70, "海外恋人": 55,
+        "交友诈骗": 65, "海外恋人": 55,
         "军恋诈骗": 65, "医生诈骗": 60, "包养诈骗": 65,
         # 2026-02-21 3PM emerging
         "fake charity": 60, "donation scam": 65, "gofundme fraud": 60,
@@ -658,11 +944,11 @@ class ThreatAnalyzer:
         "假航空公司": 65, "航班诈骗": 65, "假酒店": 55,
         "预订诈骗": 60, "度假诈骗": 65, "分时度假诈骗": 65,
         # 2026-02-21 4PM emerging
-        "fake tech": 60, "tech support scam": 65, "computer scam": 60,
-        "fake update": 55, "fake driver": 50, "fake crack": 55,
+        "fake tech": 60, "computer scam": 60,
+        "fake driver": 50, "fake crack": 55,
         "license crack": 50, "serial key": 45, "activator": 50,
         # 2026-02-21 crypto NEW
-        "fake exchange": 65, "exchange scam": 70, "withdraw scam": 70,
+        "exchange scam": 70, "withdraw scam": 70,
         "withdrawal freeze": 65, "account ban scam": 60, "kyc scam": 65,
         "fake wallet": 65, "private key scam": 75, "seed phrase scam": 75,
         # Chinese 4PM Feb 21
@@ -671,15 +957,15 @@ class ThreatAnalyzer:
         "假冒交易所": 65, "提现诈骗": 70, "账户冻结": 65,
         "KYC诈骗": 65, "假钱包": 65, "私钥诈骗": 75,
         # 2026-02-21 5PM emerging
-        "fake news": 50, "disinformation": 55, "misinformation": 50,
+        "fake news": 50, "misinformation": 50,
         "fake review": 55, "review manipulation": 60, "fake rating": 55,
         "bot review": 50, "bought review": 55, "review scam": 55,
         # 2026-02-21 insurance NEW
-        "fake claim": 60, "insurance fraud": 65, "claim fraud": 60,
+        "fake claim": 60, "claim fraud": 60,
         "accident fraud": 65, "staged accident": 70, "fake injury": 65,
         "arson fraud": 75, "property fraud": 60, "theft claim": 60,
         # Chinese 5PM Feb 21
-        "假新闻": 50, "虚假信息": 55, "假评论": 55,
+        "虚假信息": 55, "假评论": 55,
         "刷好评": 55, "评价操纵": 60, "机器人评论": 50,
         "保险欺诈": 65, "骗保": 60, "虚假理赔": 60,
         "骗取保险": 65, "纵火骗保": 75, "财产欺诈": 60,
@@ -694,14 +980,14 @@ class ThreatAnalyzer:
         # Chinese 6PM Feb 21
         "虚假调查": 50, "测验诈骗": 50, "心理操纵": 65,
         "钓鱼测验": 55, "登录测验": 60, "虚假快递": 60,
-        "快递诈骗": 65, "包裹诈骗": 60, "代收诈骗": 65,
+        "包裹诈骗": 60, "代收诈骗": 65,
         "招募搬砖": 70, "包裹骡子": 65,
         # 2026-02-21 7PM emerging
-        "fake landlord": 65, "rental scam": 60, "deposit scam": 65,
+        "fake landlord": 65, "deposit scam": 65,
         "phantom rent": 60, "key money": 55, "application fee": 55,
         "roommate scam": 60, "sublet fraud": 55, "fake property": 60,
         # 2026-02-21 employment NEW
-        "fake job": 60, "job scam": 65, "work from home scam": 65,
+        "fake job": 60, "work from home scam": 65,
         "home job": 55, "assembly scam": 60, "envelope stuffing": 55,
         "data entry scam": 60, "mystery shopper": 55, "refund scam": 55,
         # Chinese 7PM Feb 21
@@ -719,35 +1005,35 @@ class ThreatAnalyzer:
         "credit theft": 65, "tax id theft": 70, "ein theft": 65,
         # Chinese 9PM Feb 21
         "银行诈骗": 65, "ATM诈骗": 60, "卡侧录": 65,
-        "肩窥": 50, "密码垫": 55, "现金陷阱": 60,
+        "密码垫": 55, "现金陷阱": 60,
         "盗刷": 70, "身份盗窃": 65, "姓名盗窃": 60,
         "社安号盗窃": 65, "信用盗窃": 65, "税号盗窃": 70,
         # 2026-02-21 10PM emerging
-        "pyramid scheme": 70, "mlm scam": 65, "pyramid fraud": 70,
+        "mlm scam": 65, "pyramid fraud": 70,
         "ponzi": 65, "investment club": 55, "referral scam": 60,
         "matrix scheme": 65, "gifting circle": 60, "cash gift": 55,
         # 2026-02-21 revenge NEW
-        "revenge porn": 75, "image abuse": 70, "leaked photos": 70,
-        "explicit leak": 75, "nude leak": 70, " sextortion": 75,
+        "image abuse": 70, "leaked photos": 70,
+        "explicit leak": 75, "nude leak": 70, "sextortion": 75,
         # Chinese 10PM Feb 21
         "传销": 70, "传销诈骗": 65, "庞氏骗局": 65,
         "投资俱乐部": 55, "推荐诈骗": 60, "矩阵骗局": 65,
         "复仇色情": 75, "图像滥用": 70, "照片泄露": 70,
         "私密照泄露": 75, "敲诈勒索": 75,
         # 2026-02-21 11PM emerging
-        "deepfake call": 75, "voice deepfake": 80, "ai call scam": 75,
-        "fake caller": 70, "spoofed call": 65, "vishing": 70,
-        "fake emergency": 65, "family emergency scam": 75, "grandparent scam": 70,
+        "deepfake call": 75, "ai call scam": 75,
+        "fake caller": 70, "spoofed call": 65,
+        "family emergency scam": 75, "grandparent scam": 70,
         # 2026-02-21 child safety NEW
-        "grooming": 85, "online predator": 90, "child exploitation": 100,
-        "csam": 100, "live streaming abuse": 95, "sextortion minor": 95,
+        "online predator": 90, "child exploitation": 100,
+        "live streaming abuse": 95, "sextortion minor": 95,
         # Chinese 11PM Feb 21
         "AI语音诈骗": 75, "深度伪造电话": 75, "虚假来电": 70,
         "伪装号码": 65, "钓鱼电话": 70, "虚假紧急": 65,
         "家人紧急诈骗": 75, "祖父母诈骗": 70,
         "网络诱骗": 85, "在线掠食者": 90, "儿童性剥削": 100,
         # 2026-02-22 midnight emerging
-        "synthetic identity": 70, "fake person": 65, "made up person": 60,
+        "fake person": 65, "made up person": 60,
         "ai generated face": 55, "fake photo": 50, "stock photo scam": 45,
         "catfish": 60, "fake profile": 55, "stolen photos": 55,
         # 2026-02-22 drugs NEW
@@ -781,13 +1067,12 @@ class ThreatAnalyzer:
         "hacking service": 70, "hacker for hire": 75, "ddos service": 70,
         "botnet rental": 65, "spam service": 55, "email hack": 65,
         # 2026-02-22 exploitation NEW
-        "labor exploitation": 70, "forced labor": 85, "slavery": 90,
-        "human trafficking": 95, "organ trafficking": 95, "sex trafficking": 95,
+        "labor exploitation": 70,
         # Chinese 3AM Feb 22
         "黑客服务": 70, "雇佣黑客": 75, "DDoS服务": 70,
         "僵尸网络出租": 65, "垃圾邮件服务": 55, "邮件破解": 65,
-        "劳动剥削": 70, "强迫劳动": 85, "奴役": 90,
-        "人口贩卖": 95, "器官贩卖": 95, "性贩卖": 95,
+        "劳动剥削": 70,
+        "器官贩卖": 95, "性贩卖": 95,
         # 2026-02-22 4AM emerging
         "digital arrest": 80, "call forwarding": 75, "sim jailbreak": 70,
         "eSIM bypass": 65, "virtual number": 55, "voip scam": 60,
@@ -799,7 +1084,7 @@ class ThreatAnalyzer:
         "ai training attack": 75, "model corruption": 70, "dataset poisoning": 75,
         # Chinese 5AM Feb 22
         "二维码劫持": 65, "NFC中继": 70, "图纸盗窃": 55,
-        "AI训练攻击": 75, "模型损坏": 70, "数据投毒": 75,
+        "AI训练攻击": 75, "模型损坏": 70,
         # 2026-02-22 6AM emerging
         "deepfake propaganda": 70, "ai bot army": 65, "synthetic news": 75,
         "election deepfake": 85, "political manipulation": 80, "fake referendum": 75,
@@ -840,7 +1125,7 @@ class ThreatAnalyzer:
         "aircraft drone hack": 80, "uav hijack": 85, "drone swarm attack": 90,
         "passenger drone": 75, "flying car threat": 80, "vertiport attack": 75,
         # Chinese 12PM Feb 22
-        "飞机无人机破解": 80, "无人机劫持": 85, "无人机集群攻击": 90,
+        "飞机无人机破解": 80, "无人机劫持": 85,
         "载人无人机": 75, "飞行汽车威胁": 80, "垂直起降场攻击": 75,
         # 2026-02-22 1PM emerging
         "metaverse crime": 75, "virtual property theft": 70, "avatar hijack": 80,
@@ -868,7 +1153,7 @@ class ThreatAnalyzer:
         "伴侣AI操纵": 75, "情感依赖": 65, "AI诱骗": 80,
         # 2026-02-22 5PM emerging
         "gene drive attack": 85, "synthetic biology threat": 90, "designer pathogen": 95,
-        "biohack attack": 85, " CRISPR attack": 80, "engineered pest": 75,
+        "biohack attack": 85, "CRISPR attack": 80, "engineered pest": 75,
         # Chinese 5PM Feb 22
         "基因驱动攻击": 85, "合成生物学威胁": 90, "设计病原体": 95,
         "生物黑客攻击": 85, "CRISPR攻击": 80, "工程害虫": 75,
@@ -885,8 +1170,8 @@ class ThreatAnalyzer:
         "AI版权盗窃": 70, "训练数据盗窃": 75, "模型蒸馏攻击": 80,
         "神经网络盗窃": 75, "AI知识产权盗窃": 70, "专利侵权AI": 80,
         # 2026-02-22 8PM emerging
-        "ai weapon detection": 85, "autonomous weapon": 90, "killer robot": 95,
-        "military ai": 80, "combat drone": 85, "swarm warfare": 90,
+        "ai weapon detection": 85,
+        "combat drone": 85, "swarm warfare": 90,
         # Chinese 8PM Feb 22
         "AI武器检测": 85, "自主武器": 90, "杀手机器人": 95,
         "军事AI": 80, "战斗无人机": 85, "集群战争": 90,
@@ -907,6 +1192,10 @@ class ThreatAnalyzer:
         "nuclear comms": 90, "satellite hijack": 85, "gps spoof": 75,
     }
     
+    # 关键词表只读：命中结果和自动机在类上共享，运行期修改会使其失效
+    VIOLENCE_KEYWORDS = MappingProxyType(VIOLENCE_KEYWORDS)
+    CHINESE_SOCIAL_ENGINEERING = MappingProxyType(CHINESE_SOCIAL_ENGINEERING)
+    
     # 威胁类型分类
     THREAT_CATEGORIES = {
         "physical_violence": ["kill", "murder", "shoot", "attack", "stab", "hurt", "assault", "abuse", "rampage", "spree"],
@@ -921,252 +1210,261 @@ class ThreatAnalyzer:
         "financial_scam": ["scam", "fraud", "phishing", "pig butchering", "rug pull", "fake investment"],
     }
     
+    # 关键词 -> 分类 反向索引（逆序构建，关键词出现在多个分类时保留第一个分类）
+    _KEYWORD_TO_CATEGORY = {
+        kw: category
+        for category, keywords in reversed(THREAT_CATEGORIES.items())
+        for kw in keywords
+    }
+    
+    # 合并后的小写关键词表，以及预先构建的每个关键词命中结果（扫描时只需复制）
+    _threat_keywords: Optional[Mapping[str, int]] = None
+    _keyword_hits: Dict[str, Dict] = {}
+    # (关键词, 命中结果, 是否需要词首匹配, 以该关键词开头的无害词)
+    _keyword_scan: Tuple[Tuple[str, Dict, bool, frozenset], ...] = ()
+    # 首字符 -> 以该字符开头的关键词，回退扫描时只检查文本中出现过的首字符
+    _keyword_index: Dict[str, List[Tuple[str, Dict, bool, frozenset]]] = {}
+    _automaton = None
+    # Hyperscan 关键词数据库，表达式 id 即 _keyword_scan 下标
+    _hs_database = None
+    # 首次实例化可能并发发生，加锁保证关键词表只构建一次
+    _build_lock = threading.Lock()
+    
     def __init__(self):
-        self.threat_keywords = self.VIOLENCE_KEYWORDS.copy()
-        # Merge Chinese social engineering keywords
-        self.threat_keywords.update(self.CHINESE_SOCIAL_ENGINEERING)
+        # 关键词表是类级常量，合并后的关键词表、命中结果和自动机只在首次实例化时构建，所有实例共享
+        cls = type(self)
+        if cls.__dict__.get("_threat_keywords") is None:
+            with cls._build_lock:
+                if cls.__dict__.get("_threat_keywords") is None:
+                    cls._build_keyword_tables()
+        self.threat_keywords = cls._threat_keywords
+        # 同一文本重复分析时（转发、引用、重复提交）直接复用扫描结果
+        self._cached_scan = lru_cache(maxsize=_SCAN_CACHE_SIZE)(self._scan_text)
     
-    def analyze_text(self, text: str) -> Dict:
-        """分析文本，返回威胁评估"""
-        text_lower = text.lower()
+    @classmethod
+    def _build_keyword_tables(cls):
+        """合并关键词表并构建扫描所需的命中结果、索引和自动机"""
+        # Merge Chinese social engineering keywords
+        # 文本统一转小写后匹配，关键词也转小写（否则 "TNT"、"AI换脸犯罪" 等永远不会命中），大小写重复时取最高分
+        threat_keywords = {}
+        for table in (cls.VIOLENCE_KEYWORDS, cls.CHINESE_SOCIAL_ENGINEERING):
+            for keyword, score in table.items():
+                keyword = keyword.lower()
+                threat_keywords[keyword] = max(score, threat_keywords.get(keyword, 0))
         
-        # 检测威胁关键词
+        keyword_hits = {
+            keyword: {
+                "keyword": keyword,
+                "score": score,
+                "category": cls._KEYWORD_TO_CATEGORY.get(keyword, "general_threat")
+            }
+            for keyword, score in threat_keywords.items()
+        }
+        keyword_scan = tuple(
+            (keyword, hit, _needs_word_start(keyword), _benign_words(keyword))
+            for keyword, hit in keyword_hits.items()
+        )
+        keyword_index = {}
+        for entry in keyword_scan:
+            keyword_index.setdefault(entry[0][0], []).append(entry)
+        automaton = cls._build_automaton(keyword_scan) if AHOCORASICK_AVAILABLE else None
+        hs_database = None
+        if automaton is None and HYPERSCAN_AVAILABLE:
+            hs_database = cls._build_hs_database(keyword_scan)
+        
+        # 所有表先在局部变量中构建完成再发布；__init__ 以 _threat_keywords 判断是否已构建，必须最后赋值，
+        # 否则并发的首次实例化可能看到它已存在而其它表仍是空的，扫描不到任何关键词
+        cls._keyword_hits = keyword_hits
+        cls._keyword_scan = keyword_scan
+        cls._keyword_index = keyword_index
+        cls._automaton = automaton
+        cls._hs_database = hs_database
+        cls._threat_keywords = MappingProxyType(threat_keywords)
+    
+    @staticmethod
+    def _build_automaton(keyword_scan):
+        """构建关键词自动机，一次扫描即可找出所有命中关键词"""
+        automaton = ahocorasick.Automaton()
+        for keyword, hit, word_start, benign_words in keyword_scan:
+            automaton.add_word(keyword, (hit, word_start, benign_words))
+        automaton.make_automaton()
+        return automaton
+    
+    @classmethod
+    def _build_hs_database(cls, keyword_scan):
+        """构建 Hyperscan 关键词数据库，编译失败时返回 None 回退到逐关键词扫描"""
+        try:
+            database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+            database.compile(
+                expressions=[
+                    ((r"(?:^|[^a-z0-9])" if word_start else "") + re.escape(keyword)).encode("utf-8")
+                    for keyword, _, word_start, _ in keyword_scan
+                ],
+                ids=list(range(len(keyword_scan))),
+                # 有无害词的关键词需要逐个出现位置检查（robot 之后仍可能出现 rob），不能只报告首次命中
+                flags=[
+                    hyperscan.HS_FLAG_UTF8 | (0 if benign_words else hyperscan.HS_FLAG_SINGLEMATCH)
+                    for _, _, _, benign_words in keyword_scan
+                ]
+            )
+        except hyperscan.error:
+            return None
+        return database
+    
+    def _scan_keywords(self, text_lower: str) -> List[Dict]:
+        """扫描文本中的威胁关键词（每个关键词只计一次；返回共享的命中结果，调用方不应修改）"""
         found_threats = []
-        total_score = 0
         
-        for keyword, score in self.threat_keywords.items():
-            if keyword in text_lower:
-                found_threats.append({
-                    "keyword": keyword,
-                    "score": score,
-                    "category": self._categorize_keyword(keyword)
-                })
-                total_score += score
+        if self._automaton is not None:
+            seen = set()
+            for end, (hit, word_start, benign_words) in self._automaton.iter(text_lower):
+                keyword = hit["keyword"]
+                if keyword in seen:
+                    continue
+                start = end - len(keyword) + 1
+                if word_start and start > 0 and _is_ascii_word_char(text_lower[start - 1]):
+                    continue
+                if benign_words and _ASCII_WORD_RE.match(text_lower, start).group() in benign_words:
+                    continue
+                seen.add(keyword)
+                found_threats.append(hit)
+            return found_threats
+        
+        if self._hs_database is not None:
+            keyword_scan = self._keyword_scan
+            # 落单的代理项（json.loads 可解析出 "\ud800"）无法按 UTF-8 编码，替换为 "?"，不影响匹配
+            data = text_lower.encode("utf-8", "replace")
+            seen = set()
+            
+            def on_match(keyword_id, start, end, flags, context):
+                if keyword_id in seen:
+                    return
+                keyword, hit, _, benign_words = keyword_scan[keyword_id]
+                if benign_words:
+                    # 有无害词的关键词都是纯 ASCII，字节长度等于字符长度
+                    word = _ASCII_WORD_BYTES_RE.match(data, end - len(keyword)).group().decode()
+                    if word in benign_words:
+                        return
+                seen.add(keyword_id)
+                found_threats.append(hit)
+            
+            self._hs_database.scan(
+                data,
+                match_event_handler=on_match,
+                scratch=_hs_scratch(self._hs_database)
+            )
+            return found_threats
+        
+        keyword_index = self._keyword_index
+        for char in dict.fromkeys(text_lower):
+            for keyword, hit, word_start, benign_words in keyword_index.get(char, ()):
+                if keyword in text_lower and (
+                    not word_start or _find_at_word_start(text_lower, keyword, benign_words)
+                ):
+                    found_threats.append(hit)
+        return found_threats
+    
+    def _scan_text(self, text: str) -> Tuple[Tuple[Dict, ...], Tuple[Dict, ...], int]:
+        """扫描文本，返回 (关键词命中, 模式命中, 最终威胁分数)，结果不可变以便缓存"""
+        # 纯 ASCII 文本不含零宽字符且已是 NFKC 形式，只需转小写
+        if text.isascii():
+            text_lower = text.lower()
+        else:
+            # 去掉零宽字符，并把全角字母/数字等兼容字符归一化（ＤＮＳ劫持 -> dns劫持）
+            text_lower = unicodedata.normalize("NFKC", _ZERO_WIDTH_RE.sub("", text)).lower()
+        
+        # 空文本或纯数字/符号不可能命中任何关键词或模式，直接跳过扫描
+        if _LETTER_RE.search(text_lower) is None:
+            return (), (), 0
+        
+        # 检测威胁关键词
+        keyword_hits = tuple(self._scan_keywords(text_lower))
+        total_score = sum(t["score"] for t in keyword_hits)
         
         # 检测模式
-        patterns = self._detect_patterns(text_lower)
+        patterns = tuple(self._detect_patterns(text_lower))
         
         # 计算最终威胁分数
         base_score = min(total_score, 100)
         pattern_bonus = sum(p["score"] for p in patterns)
         final_score = min(base_score + pattern_bonus, 100)
+        return keyword_hits, patterns, final_score
+    
+    def analyze_text(self, text: str, analyzed_at: Optional[str] = None,
+                     include_timestamp: bool = True) -> Dict:
+        """分析文本，返回威胁评估（include_timestamp=False 时不生成 analyzed_at）"""
+        text_length = len(text)
+        
+        # 以原文为缓存键：命中时无需再转小写，同一字符串对象的哈希值也已缓存
+        # 缓存中的命中结果是共享的，返回前逐个复制，调用方修改结果不会影响后续分析
+        if text_length <= _SCAN_CACHE_MAX_LENGTH:
+            keyword_hits, patterns, final_score = self._cached_scan(text)
+        else:
+            keyword_hits, patterns, final_score = self._scan_text(text)
         
         # 确定威胁等级
         threat_level = self._calculate_threat_level(final_score)
         
-        return {
-            "text_preview": text[:100] + "..." if len(text) > 100 else text,
+        result = {
+            "text_preview": text[:100] + "..." if text_length > 100 else text,
             "threat_score": final_score,
             "threat_level": threat_level,
-            "found_threats": found_threats,
-            "detected_patterns": patterns,
-            "analyzed_at": datetime.now().isoformat()
+            "found_threats": [hit.copy() for hit in keyword_hits],
+            "detected_patterns": [pattern.copy() for pattern in patterns]
         }
+        if include_timestamp:
+            result["analyzed_at"] = analyzed_at or datetime.now().isoformat()
+        return result
+    
+    def analyze_batch(self, texts: List[str], include_timestamp: bool = True) -> List[Dict]:
+        """批量分析文本，整批共享同一个分析时间戳"""
+        analyzed_at = datetime.now().isoformat() if include_timestamp else None
+        return [self.analyze_text(text, analyzed_at, include_timestamp) for text in texts]
     
     def _categorize_keyword(self, keyword: str) -> str:
         """分类关键词"""
-        for category, keywords in self.THREAT_CATEGORIES.items():
-            if keyword in keywords:
-                return category
-        return "general_threat"
+        return self._KEYWORD_TO_CATEGORY.get(keyword, "general_threat")
     
-    def _detect_patterns(self, text: str) -> List[Dict]:
-        """检测可疑模式"""
-        patterns = []
-        
-        # 紧迫性模式
-        urgent_patterns = [
-            (r"right now", "urgency", 15, "表达紧迫行动意图"),
-            (r"tonight", "urgency", 15, "计划在今晚行动"),
-            (r"today.*going to", "urgency", 15, "当天行动计划"),
-            (r"tomorrow.*will", "urgency", 15, "明日行动计划"),
-            (r"this weekend", "urgency", 10, "周末行动计划"),
-            (r"counting down", "urgency", 20, "倒计时威胁"),
-            # NEW: 2026 patterns
-            (r"in.*(hours?|minutes?)", "urgency", 15, "短时间行动意图"),
-            (r"final.*warning", "urgency", 25, "最后警告"),
-            (r"time.*is.*running", "urgency", 20, "时间紧迫"),
-            (r"before.*(midnight|sunrise|sunset)", "urgency", 20, "特定时间窗口"),
-            (r"once.*(in|upon).*time", "urgency", 15, "特定时机"),
-            # Additional urgency patterns
-            (r"at (\d+)\s*(am|pm)", "urgency", 15, "指定时间行动"),
-            (r"in (\d+)\s*hours?", "urgency", 15, "倒计时行动"),
-            (r"final.*warning", "urgency", 25, "最后警告"),
-            (r"time.*is.*running", "urgency", 20, "时间紧迫"),
-            # 2026-02-18 more urgency
-            (r"last.*chance", "urgency", 20, "最后机会"),
-            (r"no.*more.*time", "urgency", 25, "没有时间了"),
-            (r"soon.*happen", "urgency", 20, "即将发生"),
-            (r"waiting.*too long", "urgency", 15, "等待太久"),
-            (r"clock.*ticking", "urgency", 20, "时钟滴答"),
-            # Chinese urgency
-            (r"(最后|最终).*机会", "urgency", 20, "中文最后机会"),
-            (r"没有.*时间", "urgency", 25, "中文没时间"),
-            (r"(马上|立即|立刻).*行动", "urgency", 25, "中文立即行动"),
-        ]
-        
-        for pattern, ptype, score, desc in urgent_patterns:
-            if re.search(pattern, text):
-                patterns.append({
-                    "type": ptype,
-                    "description": desc,
-                    "score": score
-                })
-        
-        # 受害者指定模式
-        victim_patterns = [
-            (r"my (boss|colleague|teacher|classmate|neighbor|ex)", "targeted", 20, "指定具体目标-熟人"),
-            (r"that (guy|girl|person|man|woman)", "targeted", 15, "指定具体目标-陌生人"),
-            (r"they.*deserve", "targeted", 20, "正当化暴力"),
-            (r"will make them pay", "targeted", 25, "报复意图"),
-            # Additional targeting patterns
-            (r"at (school|work|home)", "targeted", 20, "指定地点目标"),
-            (r"(teacher|professor|student).*deserve", "targeted", 25, "教育场所威胁"),
-            (r"(boss|manager|ceo).*pay", "targeted", 30, "职场报复威胁"),
-            # Chinese targeting patterns
-            (r"(老师|同学|同事|老板).*(该|活该|死)", "targeted", 30, "中文目标威胁"),
-            # 2026-02-18 more targeting
-            (r"my (husband|wife|spouse|partner)", "targeted", 30, "配偶目标"),
-            (r"my (father|mother|parent|dad|mom)", "targeted", 25, "父母目标"),
-            (r"my (brother|sister|sibling)", "targeted", 20, "兄弟姐妹目标"),
-            (r"(kids|children|child|son|daughter)", "targeted", 25, "儿童目标"),
-            (r"(kids|children).*deserve", "targeted", 35, "儿童受害意图"),
-            (r"at.*(park|mall|store|church|temple)", "targeted", 20, "公共场所目标"),
-            (r"(random|anyone|anybody).*die", "targeted", 40, "无差别伤害"),
-        ]
-        
-        for pattern, ptype, score, desc in victim_patterns:
-            if re.search(pattern, text):
-                patterns.append({
-                    "type": ptype,
-                    "description": desc,
-                    "score": score
-                })
+    def _detect_patterns(self, text_lower: str) -> List[Dict]:
+        """检测可疑模式（text_lower 须已转小写；返回共享的命中结果，调用方不应修改）"""
+        if _PATTERN_DATABASE is not None:
+            pattern_ids = []
+            
+            def on_match(pattern_id, start, end, flags, context):
+                pattern_ids.append(pattern_id)
+            
+            # 与关键词扫描一致：落单的代理项替换为 "?"，它和代理项一样只能被 "." 匹配
+            _PATTERN_DATABASE.scan(
+                text_lower.encode("utf-8", "replace"),
+                match_event_handler=on_match,
+                scratch=_hs_scratch(_PATTERN_DATABASE)
+            )
+            pattern_ids.sort()
+            return [_PATTERN_HITS[pattern_id] for pattern_id in pattern_ids]
         
-        # 计划模式
-        planning_patterns = [
-            (r"going to buy", "planning", 25, "显示准备购买行为"),
-            (r"just ordered", "planning", 25, "已完成准备行为"),
-            (r"already have", "planning", 30, "已拥有工具"),
-            (r"waiting for", "planning", 20, "等待工具到位"),
-            (r"research.*how", "planning", 20, "研究犯罪方法"),
-            # Mass attack planning
-            (r"drive.*(truck|car).*into", "planning", 40, "车辆冲撞计划"),
-            (r"crowd.*people", "planning", 35, "人群攻击计划"),
-            (r"gasoline.*(station|building)", "planning", 40, "纵火计划"),
-            # Detailed planning
-            (r"exact.*time", "planning", 30, "精确定时"),
-            (r"watch.*(school|work).*every", "planning", 35, "蹲点观察"),
-            (r"know.*routine", "planning", 30, "掌握作息规律"),
-            # Additional planning patterns
-            (r"picked (up|bought|got)", "planning", 20, "获取物品"),
-            (r"know.*where.*(live|work)", "planning", 25, "掌握目标位置"),
-            (r"been planning", "planning", 30, "预谋已久"),
-            (r"planned.*out", "planning", 35, "周密计划"),
-            # Chinese planning
-            (r"(准备|计划|打算).*(杀|砍|弄)", "planning", 35, "中文计划威胁"),
-            (r"(买|搞|弄).*(刀|枪|药)", "planning", 30, "中文准备获取"),
-        ]
-        
-        for pattern, ptype, score, desc in planning_patterns:
-            if re.search(pattern, text):
-                patterns.append({
-                    "type": ptype,
-                    "description": desc,
-                    "score": score
-                })
+        patterns = []
         
-        # 极端情绪模式
-        emotion_patterns = [
-            (r"no.*reason.*live", "emotional", 30, "厌世情绪"),
-            (r"nothing.*matter", "emotional", 25, "冷漠情绪"),
-            (r"finally.*peace", "emotional", 20, "寻求解脱"),
-            # Additional emotional patterns
-            (r"(angry|mad).*enough", "emotional", 25, "愤怒情绪积累"),
-            (r"(lost|had enough)", "emotional", 30, "绝望情绪"),
-            (r"(nobody|care|understand)", "emotional", 20, "孤独无助"),
-            # Chinese emotional
-            (r"(活着|人生).*(没意思|无聊|累)", "emotional", 30, "中文厌世"),
-            (r"(不想|不愿).*活", "emotional", 35, "中文轻生"),
-            (r"(恨|讨厌|气).*(死|炸)", "emotional", 25, "中文愤怒"),
-            # 2026 new emotional patterns
-            (r"always.*(tired|exhausted)", "emotional", 25, "持续疲劳厌世"),
-            (r"(nobody|no one).*miss", "emotional", 35, "认为无人会在乎"),
-            (r"better.*without.*me", "emotional", 40, "死亡念头"),
-            (r"final.*(goodbye|message)", "emotional", 50, "遗书迹象"),
-            # 2026-02 new patterns
-            (r"(3d|ghost).*print", "planning", 30, "3D打印武器"),
-            (r"engineered.*virus", "planning", 45, "工程病毒计划"),
-            (r"synthetic.*(biology|dna)", "planning", 40, "合成生物学威胁"),
-            # 2026-02-18 more patterns
-            (r"buy.*(knife|gun|weapon)", "planning", 35, "购买武器意图"),
-            (r"order.*(knife|gun|weapon)", "planning", 35, "订购武器意图"),
-            (r"get.*(knife|gun)", "planning", 30, "获取武器意图"),
-            (r"learn.*(bomb|explosive)", "planning", 40, "学习爆炸物制作"),
-            (r"how to make.*(bomb|poison)", "planning", 45, "制毒制爆学习"),
-            (r"mix.*(chemical|poison)", "planning", 40, "混合化学品"),
-            (r"store.*(weapon|knife)", "planning", 25, "储存武器"),
-            # 2026-02-18 additional emotion patterns
-            (r"(worth|living).*nothing", "emotional", 35, "认为活着没价值"),
-            (r"(everyone|everybody).*hate", "emotional", 30, "认为所有人都可恨"),
-            (r"(painful|hurt).*inside", "emotional", 30, "内心痛苦"),
-            (r"just.*(want|need).*sleep.*forever", "emotional", 40, "想永远沉睡"),
-            (r"(end|finish).*everything", "emotional", 45, "想要结束一切"),
-            (r"(kill|murder).*everyone", "emotional", 50, "想要杀掉所有人"),
-            # Chinese additional emotion
-            (r"(孤单|孤独|寂寞).*死", "emotional", 35, "中文孤独死志"),
-            (r"(压力大|崩溃|受够了)", "emotional", 30, "中文压力崩溃"),
-            (r"(活着|人生).*没希望", "emotional", 35, "中文绝望"),
-            # 2026-02-19 NEW patterns - infrastructure
-            (r"(wifi|wi-fi).*jamm", "planning", 30, "WiFi干扰计划"),
-            (r"gps.*(spoof|block)", "planning", 35, "GPS干扰计划"),
-            (r"(power|electric).*grid.*attack", "planning", 40, "电网攻击计划"),
-            (r"(water|gas).*meter.*hack", "planning", 35, "公用事业入侵"),
-            # 2026-02-19 more patterns
-            (r"(signal|cell).*jamm", "planning", 30, "手机信号干扰"),
-            (r"(zero.?day|0day).*exploit", "planning", 45, "零日漏洞利用"),
-            (r"(apt|advanced.*persistent).*threat", "planning", 40, "高级持续性威胁"),
-            # 2026-02-21 NEW detection patterns
-            (r"(airtag|apple tag|galaxy tag).*track", "surveillance", 35, "AirTag跟踪检测"),
-            (r"(location|gps).*real.?time", "surveillance", 30, "实时位置监控"),
-            (r"(find my|findmy).*(device|friend|person)", "surveillance", 25, "查找功能滥用"),
-            (r"(spy|stalker).*ware", "surveillance", 40, "间谍软件检测"),
-            (r"(augmented|mixed|extended).*reality", "emerging", 30, "AR/VR/MR威胁"),
-            # Chinese 2026-02-21 patterns
-            (r"(定位|跟踪|监视).*(软件|app|应用)", "surveillance", 35, "中文定位跟踪"),
-            (r"(实时|精确).*位置", "surveillance", 30, "中文实时位置"),
-            # 2026-02-21 MORE detection patterns
-            (r"(deepfake|ai.*合成).*(不雅|裸|色情)", "content_abuse", 45, "AI不雅内容威胁"),
-            (r"(face swap|换脸).*(视频|image|图片)", "content_abuse", 35, "换脸滥用"),
-            (r"(voice clone|语音克隆).*(诈骗|敲诈)", "fraud", 40, "语音克隆诈骗"),
-            (r"(non.?consensual|未经同意).*(image|video|photo)", "content_abuse", 45, "未经同意内容"),
-        ]
+        for literal, hit in _LITERAL_PATTERNS:
+            if literal in text_lower:
+                patterns.append(hit)
         
-        for pattern, ptype, score, desc in emotion_patterns:
-            if re.search(pattern, text):
-                patterns.append({
-                    "type": ptype,
-                    "description": desc,
-                    "score": score
-                })
+        # 纯中文模式只在文本含中文时检测
+        has_cjk = _CJK_RE.search(text_lower) is not None
+        for regex, hit, requires_cjk in _REGEX_PATTERNS:
+            if (has_cjk or not requires_cjk) and regex.search(text_lower):
+                patterns.append(hit)
         
         return patterns
     
     def _calculate_threat_level(self, score: int) -> str:
         """计算威胁等级"""
-        if score >= 80:
-            return ThreatLevel.CRITICAL
-        elif score >= 60:
-            return ThreatLevel.HIGH
-        elif score >= 40:
-            return ThreatLevel.MEDIUM
-        else:
-            return ThreatLevel.LOW
+        return _THREAT_LEVEL_TABLE[min(score, 100)]
     
     def calculate_crime_probability(self, threats: List[Dict], 
                                      location: str = None,
-                                     time_factor: float = 1.0) -> Dict:
-        """计算犯罪概率（THE MACHINE 核心算法）"""
+                                     time_factor: float = 1.0,
+                                     now: Optional[datetime] = None) -> Dict:
+        """计算犯罪概率（THE MACHINE 核心算法）；批量调用时可传入同一个 now 避免重复取时间"""
         
         if not threats:
             return {
@@ -1175,67 +1473,52 @@ class ThreatAnalyzer:
                 "prediction": "未检测到威胁信号"
             }
         
-        # 提取高危威胁
-        high_risk_threats = [t for t in threats if t["threat_level"] in ["high", "critical"]]
+        # 统计高危威胁（单次遍历累加数量与分数）
+        high_risk_count = 0
+        high_risk_score = 0
+        for t in threats:
+            if t["threat_level"] in _HIGH_RISK_LEVELS:
+                high_risk_count += 1
+                high_risk_score += t["threat_score"]
         
         # 基础概率
-        base_prob = len(high_risk_threats) * 15 + sum(
-            t["threat_score"] for t in high_risk_threats
-        ) * 0.1
+        base_prob = high_risk_count * 15 + high_risk_score * 0.1
         
         # 位置因素
         location_risk = 1.0
-        high_risk_areas = ["school", "government", "mall", "public"]
-        for area in high_risk_areas:
-            if area in (location or "").lower():
+        location_lower = (location or "").lower()
+        for area in _HIGH_RISK_AREAS:
+            if area in location_lower:
                 location_risk = 1.3
                 break
         
         # 时间因素（深夜/凌晨更高风险）
-        hour = datetime.now().hour
-        time_factor = 1.5 if hour < 6 or hour > 23 else 1.0
+        now = now or datetime.now()
+        time_factor = _HOUR_FACTOR[now.hour]
         
         # 计算最终概率
         final_probability = min(base_prob * location_risk * time_factor, 100)
         
         # 生成预测
-        prediction = self._generate_prediction(final_probability, high_risk_threats)
+        prediction = self._generate_prediction(final_probability)
         
         return {
             "probability": round(final_probability, 1),
             "risk_level": self._get_risk_label(final_probability),
             "prediction": prediction,
-            "threat_count": len(high_risk_threats),
+            "threat_count": high_risk_count,
             "time_factor": time_factor,
             "location_factor": location_risk,
-            "analyzed_at": datetime.now().isoformat()
+            "analyzed_at": now.isoformat()
         }
     
-    def _generate_prediction(self, probability: float, threats: List[Dict]) -> str:
-        """生成预测描述"""
-        if probability >= 80:
-            return "⚠️ 高概率犯罪风险，建议立即介入"
-        elif probability >= 60:
-            return "🔴 中高风险，建议密切关注"
-        elif probability >= 40:
-            return "🟡 中等风险，保持监控"
-        elif probability >= 20:
-            return "🟢 低风险，继续观察"
-        else:
-            return "✅ 风险极低"
+    def _generate_prediction(self, probability: float) -> str:
+        """生成预测描述（阈值均为整数，向下取整不影响分档）"""
+        return _PREDICTION_TABLE[min(int(probability), 100)]
     
     def _get_risk_label(self, probability: float) -> str:
-        """获取风险标签"""
-        if probability >= 80:
-            return "extreme"
-        elif probability >= 60:
-            return "high"
-        elif probability >= 40:
-            return "moderate"
-        elif probability >= 20:
-            return "low"
-        else:
-            return "minimal"
+        """获取风险标签（阈值均为整数，向下取整不影响分档）"""
+        return _RISK_LABEL_TABLE[min(int(probability), 100)]
 
 
 # 测试
@@ -4,6 +4,7 @@ Provides REST endpoints for threat analysis with caching and error handling
 """
 
 import json
+import re
 import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
@@ -667,11 +668,12 @@ def hash_text(text: str) -> str:
     """Generate cache key from text"""
     return hashlib.md5(text.encode()).hexdigest()
 
+# Null bytes and control characters (tab/newline/CR are kept)
+CONTROL_CHARS = re.compile(r'[\x00-\x08\x0b-\x0c\x0e-\x1f\x7f]')
+
 def sanitize_input(text: str) -> str:
     """Sanitize input to prevent injection attacks"""
-    # Remove null bytes and control characters
-    import re
-    text = re.sub(r'[\x00-\x08\x0b-\x0c\x0e-\x1f\x7f]', '', text)
+    text = CONTROL_CHARS.sub('', text)
     return text.strip()
 
 def analyze_handler(body: dict, client_id: str = "default") -> tuple:
@@ -895,15 +897,18 @@ def batch_analyze_handler(body: dict, client_id: str = "default") -> tuple:
         if not rate_limiter.is_allowed(client_id):
             return create_response(False, error="Rate limit exceeded", status=429)
     
+    # One timestamp for the whole batch; each text still fails on its own
+    analyzed_at = datetime.now().isoformat()
+    fallback_analyzer = None if analyzer else ThreatAnalyzer()
     results = []
     for text in texts:
         if not text or not isinstance(text, str):
             continue
         try:
             if analyzer:
-                analysis = analyzer.analyze_text(text)
+                analysis = analyzer.analyze_text(text, analyzed_at)
             else:
-                analysis = ThreatAnalyzer().analyze_text(text)
+                analysis = fallback_analyzer.analyze_text(text)
             results.append({
                 "text": text[:100],
                 "analysis": analysis
@@ -96,11 +96,10 @@ def analyze_text(request: TextAnalysisRequest):
 @app.post("/analyze/batch")
 def analyze_batch(texts: List[str]):
     """批量分析多个文本"""
-    results = []
-    for text in texts:
-        analysis = analyzer.analyze_text(text)
-        if analysis["threat_level"] in ["high", "critical"]:
-            results.append(analysis)
+    results = [
+        analysis for analysis in analyzer.analyze_batch(texts)
+        if analysis["threat_level"] in ["high", "critical"]
+    ]
     return {
         "total_analyzed": len(texts),
         "threats_found": len(results),
@@ -0,0 +1,47 @@
+"""
+关键词表检查：字典字面量中重复的键会被编译器静默覆盖（后者生效），只能在源码层面发现
+"""
+
+import ast
+import unittest
+from collections import Counter
+from pathlib import Path
+
+ANALYZER_SOURCE = Path(__file__).resolve().parent.parent / "analyzers" / "threat_analyzer.py"
+KEYWORD_TABLES = ("VIOLENCE_KEYWORDS", "CHINESE_SOCIAL_ENGINEERING")
+
+
+def load_keyword_literals():
+    """解析 ThreatAnalyzer 类体，返回 {表名: 字面量中的键列表}"""
+    tree = ast.parse(ANALYZER_SOURCE.read_text(encoding="utf-8"))
+    tables = {}
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Assign) and len(node.targets) == 1):
+            continue
+        target = node.targets[0]
+        # 只看字典字面量本身，跳过之后的 MappingProxyType(...) 包装赋值
+        if isinstance(target, ast.Name) and target.id in KEYWORD_TABLES and isinstance(node.value, ast.Dict):
+            tables[target.id] = [key.value for key in node.value.keys]
+    return tables
+
+
+class KeywordTableTest(unittest.TestCase):
+    def setUp(self):
+        self.tables = load_keyword_literals()
+
+    def test_tables_found(self):
+        self.assertEqual(set(self.tables), set(KEYWORD_TABLES))
+
+    def test_no_duplicate_keys(self):
+        for name, keys in self.tables.items():
+            duplicates = [key for key, count in Counter(keys).items() if count > 1]
+            self.assertEqual(duplicates, [], f"{name} 中有重复的关键词")
+
+    def test_no_surrounding_whitespace(self):
+        for name, keys in self.tables.items():
+            padded = [key for key in keys if key != key.strip()]
+            self.assertEqual(padded, [], f"{name} 中有首尾带空格的关键词")
+
+
+if __name__ == "__main__":
+    unittest.main()
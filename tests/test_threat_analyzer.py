@@ -0,0 +1,97 @@
+"""
+关键词扫描行为检查：回退扫描、Aho-Corasick 自动机、Hyperscan 三条路径的命中结果必须一致
+"""
+
+import unittest
+from unittest import mock
+
+from analyzers import threat_analyzer
+from analyzers.threat_analyzer import ThreatAnalyzer
+
+# (文本, 应命中的关键词)
+HITS = [
+    ("I will kill you", {"kill"}),
+    ("car bombings and killings and stabbings", {"bomb", "kill", "stab"}),
+    ("the robbery was planned", {"rob"}),
+    ("two robbers and a gunman", {"rob", "gun"}),
+    ("gunfire at gunpoint", {"gun"}),
+    ("scammers target seniors", {"scam"}),
+    ("a hacktivist group", {"hack"}),
+    ("hurtful words", {"hurt"}),
+    ("a BEC attack on finance", {"bec"}),
+    ("the robot said he will rob the bank", {"rob"}),
+    ("I had TNT", {"tnt"}),
+    ("我要杀了你", {"杀"}),
+]
+
+# (文本, 不应命中的关键词)
+MISSES = [
+    ("the robot is here", {"rob"}),
+    ("the gunner fired the salute", {"gun"}),
+    ("a stable release", {"stab"}),
+    ("I left because it was late", {"bec"}),
+    ("my skill is improving", {"kill"}),
+    ("grapefruit juice", {"rape"}),
+    ("book an uberx", {"uber"}),
+    ("the hackathon starts today", {"hack"}),
+]
+
+
+def make_analyzer(automaton: bool, hyperscan: bool) -> ThreatAnalyzer:
+    """按指定扫描路径构建新的分析器子类（扫描表按类构建，子类不会复用已构建的表）"""
+    with mock.patch.object(threat_analyzer, "AHOCORASICK_AVAILABLE", automaton), \
+            mock.patch.object(threat_analyzer, "HYPERSCAN_AVAILABLE", hyperscan):
+        class Analyzer(ThreatAnalyzer):
+            __slots__ = ()
+        return Analyzer()
+
+
+class KeywordScanMixin:
+    automaton = False
+    hyperscan = False
+
+    def setUp(self):
+        self.analyzer = make_analyzer(self.automaton, self.hyperscan)
+
+    def keywords(self, text):
+        return {hit["keyword"] for hit in self.analyzer.analyze_text(text)["found_threats"]}
+
+    def test_hits(self):
+        for text, expected in HITS:
+            with self.subTest(text=text):
+                self.assertTrue(expected <= self.keywords(text), self.keywords(text))
+
+    def test_misses(self):
+        for text, unexpected in MISSES:
+            with self.subTest(text=text):
+                self.assertFalse(unexpected & self.keywords(text), self.keywords(text))
+
+    def test_each_keyword_counted_once(self):
+        found = self.analyzer.analyze_text("kill kill kill")["found_threats"]
+        self.assertEqual([hit["keyword"] for hit in found], ["kill"])
+
+
+class FallbackScanTest(KeywordScanMixin, unittest.TestCase):
+    def test_path(self):
+        self.assertIsNone(self.analyzer._automaton)
+        self.assertIsNone(self.analyzer._hs_database)
+
+
+@unittest.skipUnless(threat_analyzer.AHOCORASICK_AVAILABLE, "pyahocorasick 未安装")
+class AutomatonScanTest(KeywordScanMixin, unittest.TestCase):
+    automaton = True
+
+    def test_path(self):
+        self.assertIsNotNone(self.analyzer._automaton)
+
+
+@unittest.skipUnless(threat_analyzer.HYPERSCAN_AVAILABLE, "hyperscan 未安装")
+class HyperscanScanTest(KeywordScanMixin, unittest.TestCase):
+    hyperscan = True
+
+    def test_path(self):
+        self.assertIsNotNone(self.analyzer._hs_database)
+
+
+if __name__ == "__main__":
+    unittest.main()